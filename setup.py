@@ -24,7 +24,8 @@ setup(
 
     # Project uses reStructuredText, so ensure that the docutils get
     # installed or upgraded on the target machine
-    install_requires=['paramiko>=1.15.2'],
+    install_requires=['paramiko>=1.15.2', 'futures; python_version < "3"'],
+    extras_require={'asyncssh': ['asyncssh']},
 
     # metadata for upload to PyPI
     author="Jeff Hinrichs",
@@ -0,0 +1,91 @@
+'''test the asyncssh transfer backend - uses py.test'''
+# pylint: disable=W0142
+import os
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+from dhp.test import tempfile_containing
+import paramiko
+import pytest
+
+from common import SKIP_IF_CI, SFTP_LOCAL, STARS8192, VFS, conn
+import pysftp
+
+pytest.importorskip('asyncssh')
+
+
+def asyncssh_conn():
+    '''return connection arguments using the asyncssh transfer backend'''
+    cnopts = pysftp.CnOpts()
+    cnopts.transfer_backend = 'asyncssh'
+    copts = SFTP_LOCAL.copy()
+    copts['cnopts'] = cnopts
+    return copts
+
+
+@SKIP_IF_CI
+def test_asyncssh_put_get():
+    '''upload and download a file with asyncssh'''
+    with pysftp.Connection(**asyncssh_conn()) as sftp:
+        sftp.chdir('/home/test')
+        with tempfile_containing(contents=STARS8192) as fname:
+            base_fname = os.path.split(fname)[1]
+            result = sftp.put(fname)
+            with tempfile_containing('') as tfile:
+                sftp.get(base_fname, tfile)
+                contents = open(tfile).read()
+            # clean up
+            sftp.remove(base_fname)
+        assert sftp._asyncssh is not None
+    assert sftp._asyncssh is None
+    assert result.st_size == 8192
+    assert contents == STARS8192
+
+
+@SKIP_IF_CI
+def test_asyncssh_get_bad_remote():
+    '''a missing remote file raises IOError'''
+    with pysftp.Connection(**asyncssh_conn()) as sftp:
+        with tempfile_containing('') as fname:
+            with pytest.raises(IOError):
+                sftp.get('readme-not-there.txt', fname)
+
+
+def key_conn(sftpserver, private_key):
+    '''return sftpserver connection arguments using the asyncssh transfer
+    backend and authenticating with private_key'''
+    cnopts = pysftp.CnOpts()
+    cnopts.transfer_backend = 'asyncssh'
+    copts = conn(sftpserver)
+    del copts['password']
+    copts['private_key'] = private_key
+    copts['cnopts'] = cnopts
+    return copts
+
+
+def test_asyncssh_get_pkey(sftpserver):
+    '''download a file with asyncssh, authenticating with a paramiko key'''
+    key = paramiko.RSAKey.generate(1024)
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**key_conn(sftpserver, key)) as sftp:
+            client_key, = sftp._asyncssh_args['client_keys']
+            assert client_key.public_data == key.asbytes()
+            with tempfile_containing('') as fname:
+                sftp.get('read.me', fname)
+                assert sftp._asyncssh is not None
+                assert open(fname).read() == 'contents of read.me'
+
+
+def test_asyncssh_unexportable_pkey(sftpserver):
+    '''a paramiko key that can't be handed to asyncssh raises ValueError'''
+    key = ed25519.Ed25519PrivateKey.generate()
+    pem = key.private_bytes(serialization.Encoding.PEM,
+                            serialization.PrivateFormat.OpenSSH,
+                            serialization.NoEncryption())
+    with tempfile_containing('') as fname:
+        with open(fname, 'wb') as hkey:
+            hkey.write(pem)
+        pkey = paramiko.Ed25519Key(filename=fname)
+    with sftpserver.serve_content(VFS):
+        with pytest.raises(ValueError):
+            pysftp.Connection(**key_conn(sftpserver, pkey))
@@ -0,0 +1,48 @@
+'''test pysftp.Connection.scandir and .cached_listing - uses py.test'''
+
+from mock import patch
+
+from common import VFS, conn
+import pysftp
+
+
+def test_scandir(sftpserver):
+    '''test scandir returns attributes keyed by name'''
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**conn(sftpserver)) as sftp:
+            entries = sftp.scandir('pub')
+            assert sorted(entries) == ['foo1', 'foo2', 'make.txt']
+            assert entries['make.txt'].filename == 'make.txt'
+
+
+def test_cached_listing(sftpserver):
+    '''test that probes inside cached_listing don't stat'''
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**conn(sftpserver)) as sftp:
+            with sftp.cached_listing('pub'):
+                with patch.object(sftp.sftp_client, 'stat') as mstat:
+                    assert sftp.isfile('pub/make.txt')
+                    assert sftp.isdir('pub/make.txt') is False
+                    assert sftp.isdir('pub/foo1')
+                    assert sftp.exists('pub/foo2')
+                    assert sftp.exists('pub/not-there') is False
+                    assert sftp.lexists('pub/make.txt')
+                    assert mstat.call_count == 0
+            # outside of the block, probes stat again
+            with patch.object(sftp.sftp_client, 'stat',
+                              side_effect=IOError) as mstat:
+                assert sftp.exists('pub/make.txt') is False
+                assert mstat.call_count == 1
+
+
+def test_cached_listing_relative(sftpserver):
+    '''test cached listings follow the remote current directory'''
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**conn(sftpserver)) as sftp:
+            with sftp.cached_listing('pub'):
+                with sftp.cd('pub'):
+                    with patch.object(sftp.sftp_client, 'stat') as mstat:
+                        assert sftp.isfile('make.txt')
+                        assert mstat.call_count == 0
+                    # not the cached directory
+                    assert sftp.isfile('foo1/foo1.txt')
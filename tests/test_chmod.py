@@ -39,3 +39,12 @@ def test_chmod_simple(lsftp):
 #     fname = 'readme.txt'
 #     with pytest.raises(IOError):
 #         psftp.chmod(fname, new_mode)
+
+
+def test_st_mode_to_int():
+    '''test st_mode_to_int trims file type and special bits'''
+    assert pysftp.st_mode_to_int(0o100711) == 711
+    assert pysftp.st_mode_to_int(0o40755) == 755
+    assert pysftp.st_mode_to_int(0o41777) == 777
+    assert pysftp.st_mode_to_int(0o100044) == 44
+    assert pysftp.st_mode_to_int(0o100000) == 0
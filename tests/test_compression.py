@@ -27,3 +27,11 @@ def test_compression_enabled():
         lcompress, rcompress = sftp.active_compression
         assert lcompress != 'none'
         assert rcompress != 'none'
+
+
+def test_is_compressible():
+    '''test guessing compressibility from file extensions'''
+    assert pysftp.is_compressible('logs/app.log', 'data.csv')
+    assert pysftp.is_compressible('no-extension')
+    assert pysftp.is_compressible('movie.MP4') is False
+    assert pysftp.is_compressible('notes.txt', 'backup.tar.gz') is False
@@ -37,3 +37,47 @@ def test_connection_good(sftpserver):
     with sftpserver.serve_content(VFS):
         sftp = pysftp.Connection(**conn(sftpserver))
         sftp.close()
+
+
+def test_connection_collected(sftpserver):
+    '''an unclosed connection closes its transport when collected'''
+    import gc
+    with sftpserver.serve_content(VFS):
+        sftp = pysftp.Connection(**conn(sftpserver))
+        sftp.listdir()
+        transport = sftp._transport
+        assert transport.is_active()
+        del sftp
+        gc.collect()
+        assert not transport.is_active()
+
+
+def test_connection_close_twice(sftpserver):
+    '''closing a connection more than once is harmless'''
+    with sftpserver.serve_content(VFS):
+        sftp = pysftp.Connection(**conn(sftpserver))
+        sftp.close()
+        sftp.close()
+
+
+def test_connection_handshake_timeouts(sftpserver):
+    '''banner and auth timeouts from CnOpts are set on the transport'''
+    cnopts = pysftp.CnOpts()
+    cnopts.banner_timeout = 3
+    cnopts.auth_timeout = 4
+    copts = conn(sftpserver)
+    copts['cnopts'] = cnopts
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**copts) as sftp:
+            assert sftp._transport.banner_timeout == 3
+            assert sftp._transport.auth_timeout == 4
+
+
+def test_connection_unknown_backend(sftpserver):
+    '''an unknown transfer_backend is refused'''
+    cnopts = pysftp.CnOpts()
+    cnopts.transfer_backend = 'nope'
+    copts = conn(sftpserver)
+    copts['cnopts'] = cnopts
+    with pytest.raises(ValueError):
+        pysftp.Connection(**copts)
@@ -1,8 +1,9 @@
 '''test pysftp.Connection.execute - uses py.test'''
 
 
-from common import SKIP_IF_CI
+from common import SKIP_IF_CI, SFTP_LOCAL
 from dhp.VI import py_ver
+import pysftp
 
 
 # TODO
@@ -24,3 +25,27 @@ def test_execute_simple(lsftp):
     # confirm results are an iterable of strings (version dependent)
     for result in results:
         assert isinstance(result, type_check)
+
+
+@SKIP_IF_CI
+def test_execute_stream(lsftp):
+    '''test execute_stream yields stdout and collects stderr'''
+    stream = lsftp.execute_stream('echo out; echo err >&2')
+    assert b''.join(stream.stdout_iter()) == b'out\n'
+    assert stream.stderr == b'err\n'
+    assert stream.exit_status == 0
+
+
+@SKIP_IF_CI
+def test_execute_exit_status(lsftp):
+    '''test the exit status of execute is recorded'''
+    assert lsftp.execute('echo err >&2; exit 3') == [b'err\n']
+    assert lsftp.last_exit_status == 3
+
+
+@SKIP_IF_CI
+def test_one_shot():
+    '''test one_shot runs a command on its own connection'''
+    assert pysftp.one_shot(command='echo hi', **SFTP_LOCAL) == \
+        ([b'hi\n'], 0)
+    assert pysftp.one_shot(command='exit 3', **SFTP_LOCAL) == ([], 3)
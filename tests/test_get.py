@@ -66,3 +66,40 @@ def test_get_glob_fails(sftpserver):
             with tempfile_containing('') as fname:
                 with pytest.raises(IOError):
                     psftp.get('*', fname)
+
+
+def test_get_block_size(sftpserver):
+    '''download a file using small, pipelined read requests'''
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**conn(sftpserver)) as psftp:
+            psftp.cwd('pub/foo1')
+            with tempfile_containing('') as fname:
+                psftp.get('foo1.txt', fname, block_size=4)
+                assert open(fname, 'rb').read() == b'content of foo1.txt'
+
+
+def test_get_many(sftpserver):
+    '''download several files, each over its own SFTP session'''
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**conn(sftpserver)) as psftp:
+            psftp.cwd('pub/foo1')
+            with tempfile_containing('') as fname1:
+                with tempfile_containing('') as fname2:
+                    psftp.get_many([('foo1.txt', fname1),
+                                    ('image01.jpg', fname2)])
+                    assert open(fname1, 'rb').read() == \
+                        b'content of foo1.txt'
+                    assert open(fname2, 'rb').read() == \
+                        b'data for image01.jpg'
+
+
+def test_get_many_missing(sftpserver):
+    '''get_many raises IOError when one of the files doesn't exist'''
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**conn(sftpserver)) as psftp:
+            psftp.cwd('pub/foo1')
+            with tempfile_containing('') as fname1:
+                with tempfile_containing('') as fname2:
+                    with pytest.raises(IOError):
+                        psftp.get_many([('foo1.txt', fname1),
+                                        ('missing.txt', fname2)])
@@ -0,0 +1,25 @@
+'''test importing pysftp - uses py.test'''
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pysftp
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='needs PEP 562')
+def test_import_is_lazy():
+    '''importing pysftp should not import paramiko'''
+    code = 'import sys, pysftp; sys.exit("paramiko" in sys.modules)'
+    cwd = os.path.dirname(os.path.abspath(pysftp.__file__))
+    assert subprocess.call([sys.executable, '-c', code], cwd=cwd) == 0
+
+
+def test_paramiko_exports():
+    '''paramiko's exceptions are still available from pysftp'''
+    import paramiko
+    assert pysftp.SSHException is paramiko.SSHException
+    assert pysftp.AuthenticationException is paramiko.AuthenticationException
+    with pytest.raises(AttributeError):
+        pysftp.NotAThing
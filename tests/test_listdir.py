@@ -26,3 +26,21 @@ def test_listdir_attr(sftpserver):
             # test that longname is there
             for attr in attrs:
                 assert attr.longname is not None
+
+
+def test_iterdir(sftpserver):
+    '''test iterdir yields SFTPAttributes of the entries'''
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**conn(sftpserver)) as sftp:
+            names = sorted(attr.filename for attr in sftp.iterdir('pub'))
+            assert names == ['foo1', 'foo2', 'make.txt']
+
+
+def test_listdir_while_prefetching(sftpserver):
+    '''test listdir while a prefetched file still has reads in flight'''
+    vfs = {'home': {'test': {'big.bin': '*' * (8 * 1024 * 1024),
+                             'pub': {'make.txt': 'content of make.txt'}}}}
+    with sftpserver.serve_content(vfs):
+        with pysftp.Connection(**conn(sftpserver)) as sftp:
+            with sftp.open('big.bin', prefetch=True):
+                assert sftp.listdir('pub') == ['make.txt']
@@ -1,5 +1,7 @@
 '''test pysftp.Connection.mkdir - uses py.test'''
 
+import pytest
+
 from common import VFS, conn, SKIP_IF_CI
 import pysftp
 
@@ -35,3 +37,20 @@ def test_mkdir(sftpserver):
 #     assert dirname not in psftp.listdir()
 #     with pytest.raises(IOError):
 #         psftp.mkdir(dirname)
+
+
+def test_octal_mode():
+    '''test conversion of int representations of octal modes'''
+    assert pysftp._octal_mode(777) == 0o777
+    assert pysftp._octal_mode(711) == 0o711
+    assert pysftp._octal_mode(1777) == 0o1777
+    assert pysftp._octal_mode(0) == 0
+    assert pysftp._octal_mode('644') == 0o644
+    with pytest.raises(ValueError):
+        pysftp._octal_mode(789)
+    with pytest.raises(ValueError):
+        pysftp._octal_mode(8000)
+    with pytest.raises(ValueError):
+        pysftp._octal_mode(17777)
+    with pytest.raises(ValueError):
+        pysftp._octal_mode(-755)
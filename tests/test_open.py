@@ -23,3 +23,13 @@ def test_open_read_with(sftpserver):
             with psftp.open('make.txt') as rfile:
                 contents = rfile.read()
             assert contents == b'content of make.txt'
+
+
+def test_open_read_prefetch(sftpserver):
+    '''test the open function with prefetching enabled'''
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**conn(sftpserver)) as psftp:
+            psftp.chdir('pub')
+            with psftp.open('make.txt', prefetch=True) as rfile:
+                contents = rfile.read()
+            assert contents == b'content of make.txt'
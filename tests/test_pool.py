@@ -0,0 +1,108 @@
+'''test pysftp.connect connection pooling - uses py.test'''
+# pylint: disable=W0142
+from dhp.test import tempfile_containing
+import paramiko
+import pytest
+
+from common import VFS, conn
+import pysftp
+
+
+def test_pool_reuse(sftpserver):
+    '''a closed pooled connection is handed out again'''
+    with sftpserver.serve_content(VFS):
+        with pysftp.connect(**conn(sftpserver)) as sftp:
+            transport = sftp._transport
+            sftp.chdir('pub')
+        assert transport.is_active()
+        with pysftp.connect(**conn(sftpserver)) as sftp2:
+            assert sftp2._transport is transport
+            # a new sftp session, back at the default path
+            assert sftp2.listdir() == ['pub', 'read.me']
+        pysftp.clear_pool()
+        assert not transport.is_active()
+
+
+def test_pool_reuse_exit_status(sftpserver):
+    '''a reused connection doesn't report the last holder's exit status'''
+    with sftpserver.serve_content(VFS):
+        with pysftp.connect(**conn(sftpserver)) as sftp:
+            sftp._last_exit_status = 3     # as if execute() had run
+        with pysftp.connect(**conn(sftpserver)) as sftp2:
+            assert sftp2._transport is sftp._transport
+            assert sftp2.last_exit_status is None
+        pysftp.clear_pool()
+
+
+def test_pool_released_closed(sftpserver):
+    '''a connection returned to the pool can't be used by its old owner'''
+    with sftpserver.serve_content(VFS):
+        sftp = pysftp.connect(**conn(sftpserver))
+        sftp.close()
+        sftp2 = pysftp.connect(**conn(sftpserver))
+        with pytest.raises(pysftp.SSHException):
+            sftp.listdir()
+        assert sftp2.listdir() == ['pub', 'read.me']
+        sftp2.close()
+        pysftp.clear_pool()
+
+
+def test_pool_different_credentials(sftpserver):
+    '''connections are only shared between identical credentials'''
+    with sftpserver.serve_content(VFS):
+        sftp = pysftp.connect(**conn(sftpserver))
+        sftp.close()
+        copts = conn(sftpserver)
+        copts['password'] = 'other'
+        with pysftp.connect(**copts) as sftp2:
+            assert sftp2._transport is not sftp._transport
+        pysftp.clear_pool()
+
+
+def test_pool_different_passphrase(sftpserver):
+    '''a wrong key passphrase fails, even with a pooled connection'''
+    key = paramiko.RSAKey.generate(1024)
+    with tempfile_containing('') as fname:
+        key.write_private_key_file(fname, password='right')
+        copts = conn(sftpserver)
+        del copts['password']
+        copts['private_key'] = fname
+        with sftpserver.serve_content(VFS):
+            with pysftp.connect(private_key_pass='right', **copts):
+                pass
+            with pytest.raises(pysftp.SSHException):
+                pysftp.connect(private_key_pass='wrong', **copts)
+            pysftp.clear_pool()
+
+
+def test_pool_different_cnopts(sftpserver):
+    '''connections are only shared between identical connection options'''
+    with sftpserver.serve_content(VFS):
+        sftp = pysftp.connect(**conn(sftpserver))
+        transport = sftp._transport
+        sftp.close()
+        cnopts = pysftp.CnOpts()
+        cnopts.stat_cache_ttl = 0
+        copts = conn(sftpserver)
+        copts['cnopts'] = cnopts
+        with pysftp.connect(**copts) as sftp2:
+            assert sftp2._transport is not transport
+            assert sftp2._cnopts.stat_cache_ttl == 0
+        pysftp.clear_pool()
+
+
+def test_pool_size(sftpserver):
+    '''idle connections beyond POOL_SIZE are closed'''
+    with sftpserver.serve_content(VFS):
+        old_size = pysftp.POOL_SIZE
+        pysftp.POOL_SIZE = 1
+        try:
+            sftp1 = pysftp.connect(**conn(sftpserver))
+            sftp2 = pysftp.connect(**conn(sftpserver))
+            sftp1.close()
+            sftp2.close()
+            assert not sftp1._transport.is_active()
+            assert sftp2._transport.is_active()
+        finally:
+            pysftp.POOL_SIZE = old_size
+            pysftp.clear_pool()
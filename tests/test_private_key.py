@@ -0,0 +1,69 @@
+'''test loading private key files - uses py.test'''
+
+import os
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+from dhp.test import tempfile_containing
+import paramiko
+import pytest
+
+import pysftp
+
+
+def test_load_rsa_key():
+    '''an RSA PEM key is read as an RSAKey'''
+    key = paramiko.RSAKey.generate(1024)
+    with tempfile_containing('') as fname:
+        key.write_private_key_file(fname)
+        loaded = pysftp._load_private_key(fname, None)
+    assert isinstance(loaded, paramiko.RSAKey)
+    assert loaded == key
+
+
+def test_load_ecdsa_key():
+    '''an EC PEM key is read as an ECDSAKey'''
+    key = paramiko.ECDSAKey.generate()
+    with tempfile_containing('') as fname:
+        key.write_private_key_file(fname)
+        loaded = pysftp._load_private_key(fname, None)
+    assert isinstance(loaded, paramiko.ECDSAKey)
+
+
+@pytest.mark.skipif(not hasattr(paramiko.PKey, 'from_path'),
+                    reason='needs paramiko 3.2+')
+def test_load_openssh_ed25519_key():
+    '''an OpenSSH format ed25519 key is read as an Ed25519Key'''
+    key = ed25519.Ed25519PrivateKey.generate()
+    pem = key.private_bytes(serialization.Encoding.PEM,
+                            serialization.PrivateFormat.OpenSSH,
+                            serialization.NoEncryption())
+    with tempfile_containing('') as fname:
+        with open(fname, 'wb') as hkey:
+            hkey.write(pem)
+        loaded = pysftp._load_private_key(fname, None)
+    assert isinstance(loaded, paramiko.Ed25519Key)
+
+
+@pytest.mark.skipif(not hasattr(paramiko.PKey, 'from_path'),
+                    reason='needs paramiko 3.2+')
+def test_load_encrypted_openssh_key():
+    '''an encrypted OpenSSH format key is read with a str passphrase'''
+    key = ed25519.Ed25519PrivateKey.generate()
+    pem = key.private_bytes(serialization.Encoding.PEM,
+                            serialization.PrivateFormat.OpenSSH,
+                            serialization.BestAvailableEncryption(b'secret'))
+    with tempfile_containing('') as fname:
+        with open(fname, 'wb') as hkey:
+            hkey.write(pem)
+        loaded = pysftp._load_private_key(fname, 'secret')
+    assert isinstance(loaded, paramiko.Ed25519Key)
+
+
+def test_load_missing_key():
+    '''a missing key file raises IOError'''
+    with tempfile_containing('') as fname:
+        pass
+    assert not os.path.exists(fname)
+    with pytest.raises(IOError):
+        pysftp._load_private_key(fname, None)
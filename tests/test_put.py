@@ -96,3 +96,33 @@ def test_put_preserve_mtime(lsftp):
     assert int(base.st_mtime) == result1.st_mtime
     # assert result1.st_atime == result2.st_atime
     assert int(result1.st_mtime) == result2.st_mtime
+
+
+@SKIP_IF_CI
+def test_put_block_size(lsftp):
+    '''upload a file using small, pipelined write requests'''
+    with tempfile_containing(contents=STARS8192) as fname:
+        base_fname = os.path.split(fname)[1]
+        lsftp.chdir('/home/test')
+        result = lsftp.put(fname, block_size=1000)
+        with lsftp.open(base_fname) as rfile:
+            contents = rfile.read()
+        # clean up
+        lsftp.remove(base_fname)
+    assert result.st_size == 8192
+    assert contents == STARS8192.encode('ascii')
+
+
+@SKIP_IF_CI
+def test_put_many(lsftp):
+    '''upload several files, each over its own SFTP session'''
+    with tempfile_containing(contents=STARS8192) as fname1:
+        with tempfile_containing(contents='short') as fname2:
+            lsftp.chdir('/home/test')
+            results = lsftp.put_many([(fname1, None), (fname2, None)])
+            names = [os.path.split(fname)[1] for fname in (fname1, fname2)]
+            assert [attr.st_size for attr in results] == [8192, 5]
+            assert lsftp.stat(names[1]).st_size == 5
+            # clean up
+            for name in names:
+                lsftp.remove(name)
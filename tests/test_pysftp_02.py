@@ -30,6 +30,9 @@ def test_path_retreat():
     assert list(pysftp.path_retreat(pth)) == ['/foo/bar/baz',
                                               '/foo/bar',
                                               '/foo']
+    assert list(pysftp.path_retreat('/')) == []
+    assert list(pysftp.path_retreat('//foo', sep='/')) == ['//foo']
+    assert list(pysftp.path_retreat('foo/', sep='/')) == ['foo/', 'foo']
 
 
 def test_path_advance():
@@ -42,6 +45,8 @@ def test_path_advance():
     assert list(pysftp.path_advance(pth)) == ['/foo',
                                               '/foo/bar',
                                               '/foo/bar/baz']
+    assert list(pysftp.path_advance('/')) == ['/']
+    assert list(pysftp.path_advance('./foo', sep='/')) == ['.', './foo']
 
 
 @SKIP_IF_CI
@@ -0,0 +1,60 @@
+'''test pysftp.CnOpts socket options - uses py.test'''
+# pylint: disable=W0142
+import socket
+
+import pytest
+
+from common import VFS, conn
+import pysftp
+
+
+def test_sockopts_default(sftpserver):
+    '''test that a default connection disables Nagle's algorithm'''
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**conn(sftpserver)) as sftp:
+            sock = sftp._transport.sock
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+
+
+def test_sockopts_disabled(sftpserver):
+    '''test that socket tuning can be turned off'''
+    cnopts = pysftp.CnOpts()
+    cnopts.tcp_nodelay = False
+    cnopts.socket_buffer = None
+    copts = conn(sftpserver)
+    copts['cnopts'] = cnopts
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**copts) as sftp:
+            sock = sftp._transport.sock
+            assert not sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+            assert sftp.listdir() == ['pub', 'read.me']
+
+
+def test_sockopts_socket_buffer(sftpserver):
+    '''test that socket_buffer sizes the buffers of the transport socket'''
+    cnopts = pysftp.CnOpts()
+    cnopts.socket_buffer = 4096
+    copts = conn(sftpserver)
+    copts['cnopts'] = cnopts
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**copts) as sftp:
+            sock = sftp._transport.sock
+            # linux reports twice the size asked for
+            assert sock.getsockopt(socket.SOL_SOCKET,
+                                   socket.SO_RCVBUF) <= 2 * 4096
+            assert sftp.listdir() == ['pub', 'read.me']
+
+
+def test_sockopts_socket_buffer_refused():
+    '''test a refused connection raises SSHException, with or without
+    socket_buffer'''
+    sock = socket.socket()
+    sock.bind(('localhost', 0))
+    port = sock.getsockname()[1]
+    sock.close()    # nothing listens on port now
+    for bufsize in (None, 4096):
+        cnopts = pysftp.CnOpts()
+        cnopts.socket_buffer = bufsize
+        with pytest.raises(pysftp.SSHException):
+            pysftp.Connection('localhost', port=port, username='user',
+                              password='pw', cnopts=cnopts)
@@ -0,0 +1,55 @@
+'''test caching of stat results for the .exists/.isX methods - uses py.test'''
+# pylint: disable=W0142
+from mock import patch
+
+from common import VFS, conn
+import pysftp
+
+
+def test_stat_cache_reused(sftpserver):
+    '''back to back probes of a path stat it once'''
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**conn(sftpserver)) as sftp:
+            client = sftp.sftp_client
+            with patch.object(client, 'stat', wraps=client.stat) as mstat:
+                assert sftp.exists('pub')
+                assert sftp.isdir('pub')
+                assert sftp.isfile('pub') is False
+                assert sftp.exists('not-there') is False
+                assert sftp.exists('not-there') is False
+                assert mstat.call_count == 2
+
+
+def test_stat_cache_invalidated(sftpserver):
+    '''changes made through the connection discard cached results'''
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**conn(sftpserver)) as sftp:
+            assert sftp.exists('test-dir') is False
+            sftp.mkdir('test-dir')
+            assert sftp.isdir('test-dir')
+            sftp.rmdir('test-dir')
+            assert sftp.exists('test-dir') is False
+
+
+def test_stat_cache_follows_cwd(sftpserver):
+    '''relative paths are cached by where they point'''
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**conn(sftpserver)) as sftp:
+            assert sftp.isfile('read.me')
+            with sftp.cd('pub'):
+                assert sftp.exists('read.me') is False
+
+
+def test_stat_cache_disabled(sftpserver):
+    '''a stat_cache_ttl of 0 stats every time'''
+    cnopts = pysftp.CnOpts()
+    cnopts.stat_cache_ttl = 0
+    copts = conn(sftpserver)
+    copts['cnopts'] = cnopts
+    with sftpserver.serve_content(VFS):
+        with pysftp.Connection(**copts) as sftp:
+            client = sftp.sftp_client
+            with patch.object(client, 'stat', wraps=client.stat) as mstat:
+                assert sftp.exists('pub')
+                assert sftp.isdir('pub')
+                assert mstat.call_count == 2
@@ -23,3 +23,20 @@ def test_lstat(lsftp):
     rslt = lsftp.lstat(dirname)
     lsftp.rmdir(dirname)
     assert rslt.st_size >= 0
+
+
+def test_stat_subclass_override(sftpserver):
+    '''test a subclass's stat is still called after connecting'''
+    calls = []
+
+    class StatCounter(pysftp.Connection):
+        '''count calls to stat'''
+        def stat(self, remotepath):
+            calls.append(remotepath)
+            return super(StatCounter, self).stat(remotepath)
+
+    with sftpserver.serve_content(VFS):
+        with StatCounter(**conn(sftpserver)) as sftp:
+            sftp.listdir()
+            assert sftp.stat('pub').st_size is not None
+            assert calls == ['pub']